@@ -14,8 +14,8 @@ def main():
         "Hi, can you please tell me how the weather is like in Sydney today?",
         stream=True,
     )
-    for response in responses:
-        print(response)
+    for kind, payload in responses:
+        print(f"[{kind}] {payload}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 """Terminal UI for Stanley AI Agent."""
 
 import asyncio
-import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 from textual import work
@@ -9,11 +11,25 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, ScrollableContainer
 from textual.widgets import Button, Checkbox, Footer, Header, Input, RichLog, Static
 
-from stanley import Agent, tools
+from stanley import Agent, _json, tools
 
 load_dotenv()
 
 
+def format_tool_args(func_args: str) -> str:
+    """Render a tool-call argument blob, tolerating partial JSON.
+
+    With provider-side streaming the arguments string may be incomplete when
+    first seen; show the raw buffer immediately instead of waiting for (or
+    crashing on) the full payload.
+    """
+    try:
+        args = _json.loads(func_args)
+    except ValueError:
+        return func_args.strip()
+    return ", ".join(f"{k}: {v}" for k, v in args.items())
+
+
 class TerminalAgent(App):
     CSS = """
     Screen { layout: vertical; }
@@ -39,9 +55,7 @@ class TerminalAgent(App):
     def __init__(self):
         super().__init__()
         self.agent: Agent | None = None
-        self.available_tools = {
-            tool_name: getattr(tools, tool_name) for tool_name in tools.__all__
-        }
+        self.available_tools = tools.REGISTRY
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -67,12 +81,43 @@ class TerminalAgent(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Dedicated single worker: submitting the raw callable avoids the
+        # copy_context/partial wrapping that loop.run_in_executor goes through.
+        self._stream_pool = ThreadPoolExecutor(max_workers=1)
+        self._write_buf: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Resolve widgets once; query_one walks the DOM on every call.
         self.chat_log = self.query_one("#chat-log", RichLog)
+        self.user_input = self.query_one("#user-input", Input)
+        self._tool_checkboxes = {
+            tool_name: self.query_one(f"#tool-{tool_name}", Checkbox)
+            for tool_name in self.available_tools
+        }
         self.chat_log.write(
             "[bold green]Stanley Terminal Agent[/bold green]\n"
             "[dim]Type a message to start[/dim]\n"
         )
-        self.query_one("#user-input", Input).focus()
+        self.user_input.focus()
+
+    def _schedule_write(self, line: str) -> None:
+        """Buffer chat writes for ~30ms so bursts render in one compositor pass."""
+        self._write_buf.append(line)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_event_loop().call_later(
+                0.03, self._flush_writes
+            )
+
+    def _flush_writes(self) -> None:
+        self._flush_handle = None
+        if self._write_buf:
+            self.chat_log.write("\n".join(self._write_buf))
+            self._write_buf.clear()
+
+    def _drop_pending_writes(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._write_buf.clear()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "send-button":
@@ -83,10 +128,10 @@ class TerminalAgent(App):
             self.send_message()
 
     def send_message(self) -> None:
-        input_widget = self.query_one("#user-input", Input)
+        input_widget = self.user_input
         if message := input_widget.value.strip():
             input_widget.value = ""
-            self.chat_log.write(f"\n[bold blue]You:[/bold blue] {message}")
+            self._schedule_write(f"\n[bold blue]You:[/bold blue] {message}")
             self.process_message(message)
 
     @work(exclusive=True)
@@ -100,30 +145,52 @@ class TerminalAgent(App):
 
         try:
             loop = asyncio.get_event_loop()
+            pending = queue.SimpleQueue()
+            scheduled = threading.Event()
+
+            def drain() -> None:
+                # Coalesce everything queued since the last tick into one write.
+                scheduled.clear()
+                lines = []
+                while True:
+                    try:
+                        lines.append(pending.get_nowait())
+                    except queue.Empty:
+                        break
+                if lines:
+                    self._schedule_write("\n".join(lines))
+
+            def emit(line: str) -> None:
+                pending.put(line)
+                if not scheduled.is_set():
+                    scheduled.set()
+                    loop.call_soon_threadsafe(drain)
+
+            def render_tool_result(tool_messages):
+                for msg in tool_messages:
+                    if msg.get("tool_call_id"):
+                        content = msg.get("content", "")
+                        if not content.startswith("{"):
+                            emit(f"[bold green]Agent:[/bold green] {content}")
+
+            def render_assistant(response):
+                if not response.choices:
+                    return
+                for tool_call in response.choices[0].message.tool_calls or []:
+                    func_name = tool_call.function.name
+                    args_str = format_tool_args(tool_call.function.arguments)
+                    emit(f"[dim]→ {func_name}({args_str})[/dim]")
+
+            dispatch = {
+                "tool_result": render_tool_result,
+                "assistant": render_assistant,
+            }
 
             def stream_responses():
-                for response in self.agent.run(message, stream=True):
-                    if isinstance(response, list):
-                        for msg in response:
-                            if msg.get("tool_call_id"):
-                                content = msg.get("content", "")
-                                if not content.startswith("{"):
-                                    loop.call_soon_threadsafe(
-                                        self.chat_log.write,
-                                        f"[bold green]Agent:[/bold green] {content}",
-                                    )
-                    elif hasattr(response, "choices") and response.choices:
-                        for tool_call in response.choices[0].message.tool_calls or []:
-                            func_name = tool_call.function.name
-                            func_args = tool_call.function.arguments
-                            args = json.loads(func_args)
-                            args_str = ", ".join(f"{k}: {v}" for k, v in args.items())
-                            loop.call_soon_threadsafe(
-                                self.chat_log.write,
-                                f"[dim]→ {func_name}({args_str})[/dim]",
-                            )
-
-            await loop.run_in_executor(None, stream_responses)
+                for kind, payload in self.agent.run(message, stream=True):
+                    dispatch[kind](payload)
+
+            await asyncio.wrap_future(self._stream_pool.submit(stream_responses))
 
         except Exception as e:
             self.chat_log.write(f"[bold red]Error:[/bold red] {e}")
@@ -131,14 +198,15 @@ class TerminalAgent(App):
     def _create_agent(self) -> None:
         selected_tools = [
             self.available_tools[tool_name]()
-            for tool_name in self.available_tools
-            if self.query_one(f"#tool-{tool_name}", Checkbox).value
+            for tool_name, checkbox in self._tool_checkboxes.items()
+            if checkbox.value
         ]
 
         if selected_tools:
             self.agent = Agent(model="openai/gpt-4.1-mini", tools=selected_tools)
 
     def action_reset(self) -> None:
+        self._drop_pending_writes()
         self.chat_log.clear()
         self.chat_log.write(
             "[bold green]Chat reset![/bold green] Start a new conversation."
@@ -146,6 +214,7 @@ class TerminalAgent(App):
         self.agent = None
 
     def action_clear(self) -> None:
+        self._drop_pending_writes()
         self.chat_log.clear()
 
     def on_key(self, event) -> None:
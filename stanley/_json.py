@@ -0,0 +1,13 @@
+"""JSON helpers backed by orjson when installed, stdlib json otherwise."""
+
+try:
+    import orjson
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    from json import dumps, loads  # noqa: F401
@@ -1,14 +1,91 @@
-import json
+import functools
+import threading
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import litellm
 
-from stanley.base_tool import Tool
+from stanley import _json
+from stanley.base_tool import Tool, _plain_schema
+from stanley.cache import ResponseCache
 from stanley.errors import SystemPromptError
 from stanley.history import AgentHistory
 from stanley.tools import SendMessageToUser
 
+_DEFAULT_PROMPT_PATH = Path(__file__).parent / "prompts" / "system-prompt.txt"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompt(path: str) -> str:
+    """Read a prompt file once per process; use cache_clear() to force a reread."""
+    return Path(path).read_text().strip()
+
+
+class _ToolList(list):
+    """Tool list that bumps a version counter on mutation.
+
+    Derived views (the OpenAI-format schema list, the name dispatch table)
+    compare against the version to know when they must be rebuilt.
+    """
+
+    def __init__(self, iterable=()) -> None:
+        super().__init__(iterable)
+        self.version = 0
+
+    def append(self, item) -> None:
+        super().append(item)
+        self.version += 1
+
+    def extend(self, iterable) -> None:
+        super().extend(iterable)
+        self.version += 1
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self.version += 1
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self.version += 1
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self.version += 1
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def sort(self, **kwargs) -> None:
+        super().sort(**kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
+
+    def __setitem__(self, index, item) -> None:
+        super().__setitem__(index, item)
+        self.version += 1
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    # list.__iadd__/__imul__ mutate through the C-level extend/repeat, not the
+    # overrides above, so they need their own version bumps.
+    def __iadd__(self, iterable):
+        result = super().__iadd__(iterable)
+        self.version += 1
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self.version += 1
+        return result
+
 
 class BaseAgent:
     def __init__(self, system_prompt: str | None = None):
@@ -19,11 +96,10 @@ class BaseAgent:
     def setup_system_prompt(self, custom_prompt: str | None = None) -> str:
         if custom_prompt:
             return custom_prompt
-        prompt_file = Path(__file__).parent / "prompts" / "system-prompt.txt"
-        return prompt_file.read_text().strip()
+        return _load_prompt(str(_DEFAULT_PROMPT_PATH))
 
     def setup_base_tools(self) -> list:
-        return [SendMessageToUser()]
+        return _ToolList([SendMessageToUser()])
 
     @property
     def system_prompt(self):
@@ -56,74 +132,220 @@ class BaseAgent:
 
 class Agent(BaseAgent):
     _MAX_RUN_STEPS = 20
+    # Providers that require explicit cache_control markers for prompt caching.
+    # OpenAI caches prefixes automatically, so no annotation is needed there.
+    _PROMPT_CACHE_PREFIXES = ("anthropic/", "bedrock/")
 
     def __init__(
-        self, model, tools: list[Tool] | None = None, system_prompt: str | None = None
+        self,
+        model,
+        tools: list[Tool] | None = None,
+        system_prompt: str | None = None,
+        cache: ResponseCache | None = None,
+        max_history: int | None = None,
+        cache_buffer: int = 0,
     ) -> None:
         super().__init__(system_prompt=system_prompt)
         self.model = model
+        self.cache = cache
+        self.max_history = max_history
+        self.cache_buffer = cache_buffer
         self.history = AgentHistory()
+        self._cache_stats = {
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
 
         if self._system_prompt:
             self.history.add_message({"role": "system", "content": self._system_prompt})
+            self.history.promote_to_prefix(1)
 
         if tools:
             self.tools.extend(tools)
         self._step_idx = 0
+        self._tools_version = -1
+        self._tools_for_llm: list | None = None
+        self._tool_by_name: dict[str, Tool] = {}
+        self._tool_pool: ThreadPoolExecutor | None = None
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     @property
     def tools_for_llm(self):
-        """Returns tools in OpenAI format for LLM calls."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.input_schema,
-                },
-            }
-            for tool in self.tools
-        ]
+        """Returns tools in OpenAI format for LLM calls, cached per tool-set."""
+        self._refresh_tool_views()
+        if self._tools_for_llm is None:
+            self._tools_for_llm = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        # Thaw the frozen per-class schema: the wire payload
+                        # must be plain dicts for JSON serialization, and this
+                        # list is rebuilt only when the tool-set changes.
+                        "parameters": _plain_schema(tool.input_schema),
+                    },
+                }
+                for tool in self.tools
+            ]
+        return self._tools_for_llm
+
+    def _refresh_tool_views(self) -> None:
+        version = getattr(self.tools, "version", None)
+        if version is not None and version == self._tools_version:
+            return
+        self._tools_for_llm = None
+        self._tool_by_name = {tool.name: tool for tool in self.tools}
+        self._tools_version = version
 
     def _run_one_step(self):
-        response = litellm.completion(
-            model=self.model,
-            messages=self.history.load(),
-            tools=self.tools_for_llm,
-            tool_choice="required",
-        )
+        messages = self.history.build_for_llm(self.max_history, self.cache_buffer)
+        request_key = ResponseCache.make_key(self.model, self.tools_for_llm, messages)
+
+        response = self.cache.get(request_key) if self.cache is not None else None
+        if response is None:
+            response = self._completion(request_key, messages)
+            self._track_cache_usage(response)
+            if self.cache is not None and self._is_cacheable(
+                response.choices[0].message
+            ):
+                self.cache.put(request_key, response)
 
         message = response.choices[0].message
         self.history.add_message(message.model_dump())
-        yield response
+        yield ("assistant", response)
+
+        tool_calls = message.tool_calls or ()
+        if not tool_calls:
+            # Common case: plain assistant reply. Skip the tool-results
+            # assembly and the extra generator suspension entirely.
+            self._should_continue = True
+            return
 
         should_continue = True
-        if message.tool_calls:
-            tool_messages = []
-            for tool_call in message.tool_calls:
-                result = self.execute_tool_call(tool_call)
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": str(result),
-                }
-                self.history.add_message(tool_message)
-                tool_messages.append(tool_message)
-                if tool_call.function.name == "send_message_to_user":
-                    should_continue = False
-            yield tool_messages
+        results = self._execute_tool_calls(tool_calls)
+        tool_messages = []
+        for tool_call, result in zip(tool_calls, results):
+            tool_message = {
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "content": str(result),
+            }
+            self.history.add_message(tool_message)
+            tool_messages.append(tool_message)
+            if tool_call.function.name == "send_message_to_user":
+                should_continue = False
+        yield ("tool_result", tool_messages)
 
         self._should_continue = should_continue
 
+    def _completion(self, request_key: str, messages):
+        """Call the LLM, coalescing concurrent identical requests.
+
+        If another thread already has the same request in flight, wait on its
+        future instead of issuing a duplicate completion call.
+        """
+        with self._inflight_lock:
+            pending = self._inflight.get(request_key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[request_key] = Future()
+
+        if not leader:
+            return pending.result()
+
+        try:
+            response = litellm.completion(
+                model=self.model,
+                messages=self._annotate_cache_control(messages),
+                tools=self.tools_for_llm,
+                tool_choice="required",
+            )
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            pending.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(request_key, None)
+
+    @property
+    def cache_stats(self):
+        """Cumulative prompt-cache token usage reported by the provider."""
+        return dict(self._cache_stats)
+
+    def _supports_prompt_caching(self) -> bool:
+        return self.model.startswith(self._PROMPT_CACHE_PREFIXES)
+
+    def _annotate_cache_control(self, messages):
+        """Stamp ephemeral cache_control markers on the outgoing message list.
+
+        The system prompt and the last stable message before the new user turn
+        are marked so the provider caches the shared prefix. History itself is
+        never mutated — annotated copies are sent to the LLM only.
+        """
+        if not self._supports_prompt_caching() or not messages:
+            return messages
+
+        annotated = list(messages)
+        marks = {0}
+        if len(annotated) > 2:
+            marks.add(len(annotated) - 2)
+        for idx in marks:
+            annotated[idx] = {
+                **annotated[idx],
+                "cache_control": {"type": "ephemeral"},
+            }
+        return annotated
+
+    def _track_cache_usage(self, response) -> None:
+        if not self._supports_prompt_caching():
+            return
+        usage = getattr(response, "usage", None)
+        for field in self._cache_stats:
+            value = getattr(usage, field, None)
+            if isinstance(value, int):
+                self._cache_stats[field] += value
+
+    def _execute_tool_calls(self, tool_calls) -> list:
+        """Run a batch of tool calls, fanning out when all are parallel-safe.
+
+        Results are returned in the original tool-call order either way, so
+        the follow-up tool messages are identical to serial execution.
+        """
+        if len(tool_calls) > 1 and all(self._parallel_safe(tc) for tc in tool_calls):
+            if self._tool_pool is None:
+                self._tool_pool = ThreadPoolExecutor(max_workers=8)
+            return list(self._tool_pool.map(self.execute_tool_call, tool_calls))
+        return [self.execute_tool_call(tc) for tc in tool_calls]
+
+    def _lookup_tool(self, name: str) -> Tool | None:
+        self._refresh_tool_views()
+        return self._tool_by_name.get(name)
+
+    def _parallel_safe(self, tool_call) -> bool:
+        tool = self._lookup_tool(tool_call.function.name)
+        return tool is not None and getattr(tool, "parallel_safe", True)
+
+    def _is_cacheable(self, message) -> bool:
+        """A response is cacheable unless it calls a tool marked cacheable=False."""
+        for tool_call in message.tool_calls or []:
+            tool = self._lookup_tool(tool_call.function.name)
+            if tool is not None and not getattr(tool, "cacheable", True):
+                return False
+        return True
+
     def execute_tool_call(self, tool_call):
         """Execute a tool call and return the result."""
-        tool = next((t for t in self.tools if t.name == tool_call.function.name), None)
+        tool = self._lookup_tool(tool_call.function.name)
         if not tool:
             raise ValueError(f"Tool '{tool_call.function.name}' not found")
 
         kwargs = (
-            json.loads(tool_call.function.arguments)
+            _json.loads(tool_call.function.arguments)
             if isinstance(tool_call.function.arguments, str)
             else tool_call.function.arguments
         )
@@ -1,14 +1,24 @@
+import functools
 import inspect
 import types
+import weakref
 from abc import abstractmethod
 from collections.abc import Callable
 from enum import Enum
 from typing import Annotated, Any, Optional, Union, get_args, get_origin
 
 
+@functools.cache
+def _sig(fn: Callable[..., Any]) -> inspect.Signature:
+    """Memoized inspect.signature; resolving a signature walks wrappers and
+    builds Parameter objects each call, and both schema generation and
+    annotation enforcement inspect the same functions."""
+    return inspect.signature(fn)
+
+
 def get_openai_schema_from_fn(fn: Callable[..., Any]) -> dict[str, Any]:
     """Generate OpenAI function schema from function signature."""
-    sig = inspect.signature(fn)
+    sig = _sig(fn)
     props, required = {}, []
     type_map = {str: "string", int: "integer", float: "number", bool: "boolean"}
 
@@ -69,9 +79,58 @@ def get_openai_schema_from_fn(fn: Callable[..., Any]) -> dict[str, Any]:
     return {"type": "object", "properties": props, "required": required}
 
 
+def _freeze_schema(value: Any) -> Any:
+    """Recursively wrap dicts in read-only MappingProxyType views.
+
+    The schema is shared by every instance of a tool class, so one caller
+    mutating it would silently corrupt all the others. Lists (enum values,
+    required-parameter names) stay lists so equality comparisons against
+    plain-dict expectations keep working.
+    """
+    if isinstance(value, dict):
+        return types.MappingProxyType(
+            {key: _freeze_schema(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return [_freeze_schema(item) for item in value]
+    return value
+
+
+def _plain_schema(value: Any) -> Any:
+    """Inverse of _freeze_schema: rebuild plain dicts for JSON serialization."""
+    if isinstance(value, types.MappingProxyType):
+        return {key: _plain_schema(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain_schema(item) for item in value]
+    return value
+
+
+_SCHEMA_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _cached_schema(fn: Callable[..., Any]) -> dict[str, Any]:
+    """Memoized, frozen get_openai_schema_from_fn keyed on the underlying function.
+
+    Bound methods are unwrapped to their __func__ so every instance of a tool
+    class hits the same cache entry; the WeakKeyDictionary lets entries die
+    with the function they describe.
+    """
+    key = getattr(fn, "__func__", fn)
+    try:
+        return _SCHEMA_CACHE[key]
+    except (KeyError, TypeError):
+        pass
+    schema = _freeze_schema(get_openai_schema_from_fn(key))
+    try:
+        _SCHEMA_CACHE[key] = schema
+    except TypeError:
+        pass
+    return schema
+
+
 def enforce_execute_type_annotations(fn: Callable[..., Any]) -> None:
     """Ensure execute method has proper type annotations."""
-    sig = inspect.signature(fn)
+    sig = _sig(fn)
     missing = [
         name
         for name, param in sig.parameters.items()
@@ -87,13 +146,32 @@ def enforce_execute_type_annotations(fn: Callable[..., Any]) -> None:
 
 
 class Tool:
-    name: str = None
-    description: str = None
+    # No __slots__: the documented `name = "..."` class-attribute pattern
+    # shadows slot descriptors, so slotting buys nothing (instances keep a
+    # populated __dict__ anyway) and breaks subclasses that declare their
+    # own empty __slots__ while assigning name/description in __init__.
+
+    #: Whether LLM responses that call this tool may be served from a
+    #: ResponseCache. Set False on tools whose output depends on live data.
+    cacheable: bool = True
+    #: Whether this tool may run concurrently with other tool calls from the
+    #: same assistant turn. Set False on tools that mutate shared state.
+    parallel_safe: bool = True
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        cls._class_name = getattr(cls, "name", None)
-        cls._class_description = getattr(cls, "description", None)
+        # getattr can surface the slot descriptors themselves here, so only
+        # accept actual string overrides as class-level defaults.
+        name = getattr(cls, "name", None)
+        description = getattr(cls, "description", None)
+        cls._class_name = name if isinstance(name, str) else None
+        cls._class_description = description if isinstance(description, str) else None
+        # The schema depends only on the class-level execute signature, so
+        # derive it once at class-definition time. Annotation problems surface
+        # here too, rather than on first instantiation.
+        if "execute" in cls.__dict__:
+            enforce_execute_type_annotations(cls.execute)
+            cls.__input_schema__ = _cached_schema(cls.execute)
 
     def __init__(self, name=None, description=None):
         self.name = name or getattr(self.__class__, "_class_name", None)
@@ -107,8 +185,11 @@ class Tool:
                 "either as class attributes or constructor arguments"
             )
 
-        enforce_execute_type_annotations(self.execute)
-        self.input_schema = get_openai_schema_from_fn(self.execute)
+        schema = getattr(type(self), "__input_schema__", None)
+        if schema is None:
+            enforce_execute_type_annotations(self.execute)
+            schema = _cached_schema(self.execute)
+        self.input_schema = schema
 
     @abstractmethod
     def execute(self, *args, **kwargs):
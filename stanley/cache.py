@@ -0,0 +1,47 @@
+import hashlib
+import json
+import time
+from typing import Any
+
+
+class ResponseCache:
+    """Exact-match cache for LLM completions.
+
+    Entries are keyed by a digest of (model, tool schemas, messages) so an
+    identical request shape short-circuits the LLM round-trip entirely.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    @staticmethod
+    def make_key(model: str, tools: list, messages: list) -> str:
+        payload = json.dumps(
+            {"model": model, "tools": tools, "messages": messages},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        return response
+
+    def put(self, key: str, response: Any) -> None:
+        if len(self._entries) >= self.maxsize and key not in self._entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic(), response)
+
+    def clear(self) -> None:
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
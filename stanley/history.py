@@ -1,23 +1,129 @@
+from collections import deque
 from typing import Any
 
 from stanley.models import Message
 
+_GAP_MESSAGE: Message = {
+    "role": "system",
+    "content": "[Earlier messages in this conversation have been truncated.]",
+}
+
+# Distinguishes "content key absent" from an explicit content of None.
+_MISSING = object()
+
+
+class _MessageColumns:
+    """Column-oriented storage for one history segment.
+
+    Roles and contents live in their own deques so scans (role filtering,
+    token counting) touch contiguous homogeneous columns; any remaining keys
+    (tool_calls, tool_call_id, ...) go into the extras column. Message dicts
+    are materialized only when a full payload is needed.
+    """
+
+    def __init__(self, maxlen: int | None = None) -> None:
+        self.roles: deque[str] = deque(maxlen=maxlen)
+        self.contents: deque[Any] = deque(maxlen=maxlen)
+        self.extras: deque[dict | None] = deque(maxlen=maxlen)
+
+    def append(self, message: Message) -> None:
+        rest = dict(message)
+        self.roles.append(rest.pop("role"))
+        self.contents.append(rest.pop("content", _MISSING))
+        self.extras.append(rest or None)
+
+    def append_row(self, row: tuple) -> None:
+        role, content, extra = row
+        self.roles.append(role)
+        self.contents.append(content)
+        self.extras.append(extra)
+
+    def popleft_row(self) -> tuple:
+        return (self.roles.popleft(), self.contents.popleft(), self.extras.popleft())
+
+    def materialize(self) -> list[Message]:
+        out = []
+        for role, content, extra in zip(self.roles, self.contents, self.extras):
+            message = {"role": role}
+            if content is not _MISSING:
+                message["content"] = content
+            if extra:
+                message.update(extra)
+            out.append(message)
+        return out
+
+    def clear(self) -> None:
+        self.roles.clear()
+        self.contents.clear()
+        self.extras.clear()
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
 
 class AgentHistory:
-    def __init__(self) -> None:
-        self.messages: list[Message] = []
+    def __init__(self, maxlen: int | None = None) -> None:
+        self._prefix = _MessageColumns()
+        self._tail = _MessageColumns(maxlen=maxlen)
+        self._materialized: list[Message] | None = None
+
+    @property
+    def messages(self) -> list[Message]:
+        if self._materialized is None:
+            self._materialized = [
+                *self._prefix.materialize(),
+                *self._tail.materialize(),
+            ]
+        return self._materialized
 
     def add_message(self, message: Message) -> None:
-        self.messages.append(message)
+        self._tail.append(message)
+        self._materialized = None
+
+    def promote_to_prefix(self, n: int) -> None:
+        """Pin the oldest n tail messages so window truncation never drops them."""
+        for _ in range(n):
+            self._prefix.append_row(self._tail.popleft_row())
+        self._materialized = None
 
     def load(self) -> list[dict[str, Any]]:
         return self.messages
 
+    def build_for_llm(
+        self, max_messages: int | None = None, cache_buffer: int = 0
+    ) -> list[Message]:
+        """Assemble the outgoing message list without ever dropping the prefix.
+
+        When over budget, messages are dropped from the middle — between the
+        pinned prefix and the recent tail — so the prefix stays byte-stable for
+        provider prompt caches. With a cache_buffer, tail messages are promoted
+        into the prefix only at checkpoints: once the tail has outgrown the
+        remaining budget by a full buffer, and only while the grown prefix
+        still fits inside max_messages. The returned list therefore never
+        exceeds max_messages, however long the session runs.
+        """
+        if max_messages is None or len(self) <= max_messages:
+            return self.messages
+
+        budget = max_messages - len(self._prefix) - 1
+        if (
+            cache_buffer > 0
+            and len(self._tail) >= budget + cache_buffer
+            and len(self._prefix) + cache_buffer + 1 < max_messages
+        ):
+            self.promote_to_prefix(cache_buffer)
+            budget = max_messages - len(self._prefix) - 1
+
+        kept = self._tail.materialize()[-budget:] if budget > 0 else []
+        return [*self._prefix.materialize(), _GAP_MESSAGE, *kept]
+
     def clear(self) -> None:
-        self.messages = []
+        self._prefix.clear()
+        self._tail.clear()
+        self._materialized = None
 
     def __len__(self) -> int:
-        return len(self.messages)
+        return len(self._prefix) + len(self._tail)
 
     def __iter__(self):
         return iter(self.messages)
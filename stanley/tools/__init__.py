@@ -2,4 +2,10 @@ from stanley.tools.agent_end_task import AgentEndTaskTool
 from stanley.tools.google_search import GoogleSearchTool
 from stanley.tools.send_message import SendMessageToUser
 
-__all__ = ["SendMessageToUser", "GoogleSearchTool", "AgentEndTaskTool"]
+# Built once at import so callers get O(1) lookup by tool name instead of
+# walking __all__ with getattr per tool.
+REGISTRY = {
+    cls.name: cls for cls in (AgentEndTaskTool, GoogleSearchTool, SendMessageToUser)
+}
+
+__all__ = ["SendMessageToUser", "GoogleSearchTool", "AgentEndTaskTool", "REGISTRY"]
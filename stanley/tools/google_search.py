@@ -1,18 +1,26 @@
-import json
 import os
 from typing import Annotated
 
 import requests
 
+from stanley import _json
 from stanley.base_tool import Tool
 
 
 class GoogleSearchTool(Tool):
     name = "google_search"
     description = "Use this tool to search google about an input query."
+    cacheable = False
+
+    _SEARCH_URL = "https://google.serper.dev/search"
 
     def __init__(self):
         self.api_key = os.getenv("SERPER_API_KEY")
+        # Keep-alive session: repeat searches skip the TCP/TLS handshake.
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        if self.api_key:
+            self._session.headers["X-API-KEY"] = self.api_key
         super().__init__()
 
     def execute(
@@ -24,10 +32,7 @@ class GoogleSearchTool(Tool):
         if not self.api_key:
             raise ValueError("SERPER_API_KEY environment variable is required")
 
-        url = "https://google.serper.dev/search"
-        payload = json.dumps({"q": query, "num": num_results})
-        headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
-
-        response = requests.post(url, headers=headers, data=payload, timeout=10)
+        payload = _json.dumps({"q": query, "num": num_results})
+        response = self._session.post(self._SEARCH_URL, data=payload, timeout=10)
         response.raise_for_status()
         return response.json()
@@ -0,0 +1,34 @@
+"""Micro-benchmarks for the schema builder in base_tool.py.
+
+get_openai_schema_from_fn is the hot path behind Tool class definition, so any
+change to base_tool.py should be measured here. Requires pytest-benchmark
+(install the `bench` extra); the module is skipped when it is absent.
+"""
+
+import pytest
+
+from stanley.base_tool import get_openai_schema_from_fn
+from tests.test_tools import (
+    _basic_types_func,
+    _enum_func,
+    _nested_func,
+    _optional_params_func,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_bench_basic_types(benchmark):
+    benchmark(get_openai_schema_from_fn, _basic_types_func)
+
+
+def test_bench_optional_params(benchmark):
+    benchmark(get_openai_schema_from_fn, _optional_params_func)
+
+
+def test_bench_enum(benchmark):
+    benchmark(get_openai_schema_from_fn, _enum_func)
+
+
+def test_bench_nested_complex(benchmark):
+    benchmark(get_openai_schema_from_fn, _nested_func)
@@ -115,8 +115,9 @@ class TestAgent:
 
         assert hasattr(result_gen, "__iter__")
 
-        result = next(result_gen)
-        assert result == mock_response
+        kind, payload = next(result_gen)
+        assert kind == "assistant"
+        assert payload == mock_response
 
     def test_run_without_stream(self, mock_litellm, mock_response):
         mock_litellm.return_value = mock_response
@@ -135,7 +136,7 @@ class TestAgent:
 
         results = list(agent._run_one_step())
         assert len(results) == 1
-        assert results[0] == mock_response
+        assert results[0] == ("assistant", mock_response)
 
         assert len(agent.history) == 3
 
@@ -171,12 +172,147 @@ class TestAgent:
             results = list(agent._run_one_step())
 
         assert len(results) == 2
-        assert results[0] == response
-        assert isinstance(results[1], list)
-        assert len(results[1]) == 1
+        assert results[0] == ("assistant", response)
+        kind, tool_messages = results[1]
+        assert kind == "tool_result"
+        assert isinstance(tool_messages, list)
+        assert len(tool_messages) == 1
 
         assert not agent._should_continue
 
+    def test_tools_for_llm_cached_until_tools_mutate(self):
+        agent = Agent(model="gpt-4")
+
+        first = agent.tools_for_llm
+        assert agent.tools_for_llm is first
+
+        custom_tool = Mock(spec=Tool)
+        custom_tool.name = "test_tool"
+        custom_tool.description = "A test tool"
+        custom_tool.input_schema = {"type": "object", "properties": {}}
+        agent.tools.append(custom_tool)
+
+        rebuilt = agent.tools_for_llm
+        assert rebuilt is not first
+        assert len(rebuilt) == 2
+
+    def test_tools_for_llm_rebuilt_after_inplace_add(self):
+        agent = Agent(model="gpt-4")
+
+        first = agent.tools_for_llm
+
+        custom_tool = Mock(spec=Tool)
+        custom_tool.name = "test_tool"
+        custom_tool.description = "A test tool"
+        custom_tool.input_schema = {"type": "object", "properties": {}}
+        agent.tools += [custom_tool]
+
+        rebuilt = agent.tools_for_llm
+        assert rebuilt is not first
+        assert len(rebuilt) == 2
+        assert agent._lookup_tool("test_tool") is custom_tool
+
+    def test_execute_tool_calls_parallel_preserves_order(self):
+        agent = Agent(model="gpt-4")
+
+        for name in ("tool_a", "tool_b"):
+            mock_tool = Mock(spec=Tool)
+            mock_tool.name = name
+            mock_tool.parallel_safe = True
+            mock_tool.execute.return_value = f"{name} result"
+            agent.tools.append(mock_tool)
+
+        tool_calls = []
+        for name in ("tool_a", "tool_b"):
+            tool_call = Mock()
+            tool_call.function.name = name
+            tool_call.function.arguments = "{}"
+            tool_calls.append(tool_call)
+
+        results = agent._execute_tool_calls(tool_calls)
+        assert results == ["tool_a result", "tool_b result"]
+
+    def test_execute_tool_calls_serial_when_not_parallel_safe(self):
+        agent = Agent(model="gpt-4")
+
+        mock_tool = Mock(spec=Tool)
+        mock_tool.name = "stateful_tool"
+        mock_tool.parallel_safe = False
+        mock_tool.execute.return_value = "done"
+        agent.tools.append(mock_tool)
+
+        tool_call = Mock()
+        tool_call.function.name = "stateful_tool"
+        tool_call.function.arguments = "{}"
+
+        results = agent._execute_tool_calls([tool_call, tool_call])
+        assert results == ["done", "done"]
+        assert agent._tool_pool is None
+
+    def test_concurrent_identical_completions_coalesce(self, mock_litellm):
+        import threading
+        import time
+
+        def slow_completion(**kwargs):
+            time.sleep(0.2)
+            return "response"
+
+        mock_litellm.side_effect = slow_completion
+
+        agent = Agent(model="gpt-4")
+        messages = [{"role": "user", "content": "Hi"}]
+        results = []
+
+        def call():
+            results.append(agent._completion("same-key", messages))
+
+        threads = [threading.Thread(target=call) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["response", "response"]
+        assert mock_litellm.call_count == 1
+
+    def test_annotate_cache_control_anthropic(self):
+        agent = Agent(model="anthropic/claude-3-5-sonnet-20241022")
+        messages = [
+            {"role": "system", "content": "Be helpful."},
+            {"role": "user", "content": "First"},
+            {"role": "assistant", "content": "Reply"},
+            {"role": "user", "content": "Second"},
+        ]
+
+        annotated = agent._annotate_cache_control(messages)
+
+        assert annotated[0]["cache_control"] == {"type": "ephemeral"}
+        assert annotated[-2]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in annotated[-1]
+        # Originals are untouched
+        assert "cache_control" not in messages[0]
+
+    def test_annotate_cache_control_noop_for_openai(self):
+        agent = Agent(model="openai/gpt-4.1-mini")
+        messages = [{"role": "user", "content": "Hi"}]
+        assert agent._annotate_cache_control(messages) is messages
+
+    def test_cache_stats_accumulate(self):
+        agent = Agent(model="anthropic/claude-3-5-sonnet-20241022")
+
+        usage = Mock()
+        usage.cache_creation_input_tokens = 100
+        usage.cache_read_input_tokens = 40
+        response = Mock(usage=usage)
+
+        agent._track_cache_usage(response)
+        agent._track_cache_usage(response)
+
+        assert agent.cache_stats == {
+            "cache_creation_input_tokens": 200,
+            "cache_read_input_tokens": 80,
+        }
+
     def test_execute_tool_call(self):
         agent = Agent(model="gpt-4")
 
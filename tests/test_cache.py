@@ -0,0 +1,112 @@
+"""Tests for ResponseCache."""
+
+from unittest.mock import Mock, patch
+
+from stanley import Agent
+from stanley.cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_get_miss_returns_none(self):
+        cache = ResponseCache()
+        assert cache.get("missing") is None
+
+    def test_put_and_get(self):
+        cache = ResponseCache()
+        cache.put("key", "response")
+        assert cache.get("key") == "response"
+        assert len(cache) == 1
+
+    def test_make_key_is_deterministic(self):
+        messages = [{"role": "user", "content": "Hi"}]
+        key_a = ResponseCache.make_key("gpt-4", [], messages)
+        key_b = ResponseCache.make_key("gpt-4", [], list(messages))
+        assert key_a == key_b
+
+        key_c = ResponseCache.make_key("gpt-4", [], [{"role": "user", "content": "Yo"}])
+        assert key_a != key_c
+
+    def test_maxsize_evicts_oldest(self):
+        cache = ResponseCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=10.0)
+        with patch("stanley.cache.time.monotonic", side_effect=[0.0, 5.0, 20.0]):
+            cache.put("key", "response")
+            assert cache.get("key") == "response"
+            assert cache.get("key") is None
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.put("key", "response")
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestAgentResponseCaching:
+    def _mock_response(self):
+        response = Mock()
+        message = Mock()
+        message.tool_calls = []
+        message.model_dump.return_value = {
+            "role": "assistant",
+            "content": "Cached response",
+        }
+        response.choices = [Mock(message=message)]
+        return response
+
+    def test_identical_request_served_from_cache(self):
+        response = self._mock_response()
+
+        with patch("stanley.agent.litellm.completion") as mock_completion:
+            mock_completion.return_value = response
+
+            cache = ResponseCache()
+            agent = Agent(model="gpt-4", cache=cache)
+            agent.history.add_message({"role": "user", "content": "Hi"})
+
+            list(agent._run_one_step())
+            assert mock_completion.call_count == 1
+
+            # Replay the same history: the completion call is skipped.
+            agent.history.clear()
+            agent.history.add_message(
+                {"role": "system", "content": agent.system_prompt}
+            )
+            agent.history.add_message({"role": "user", "content": "Hi"})
+            list(agent._run_one_step())
+            assert mock_completion.call_count == 1
+
+    def test_non_cacheable_tool_call_not_stored(self):
+        response = self._mock_response()
+        tool_call = Mock()
+        tool_call.id = "call_123"
+        tool_call.function.name = "google_search"
+        tool_call.function.arguments = '{"query": "news"}'
+        response.choices[0].message.tool_calls = [tool_call]
+
+        with patch("stanley.agent.litellm.completion") as mock_completion:
+            mock_completion.return_value = response
+
+            cache = ResponseCache()
+            agent = Agent(model="gpt-4", cache=cache)
+            agent.history.add_message({"role": "user", "content": "Hi"})
+
+            search_tool = Mock()
+            search_tool.name = "google_search"
+            search_tool.cacheable = False
+            search_tool.execute.return_value = "{}"
+            agent.tools.append(search_tool)
+
+            with patch.object(agent, "execute_tool_call", return_value="{}"):
+                list(agent._run_one_step())
+
+            assert len(cache) == 0
@@ -75,7 +75,7 @@ class TestAgentHistory:
 
         loaded = history.load()
         assert loaded == messages
-        assert loaded is history.messages
+        assert loaded == history.messages
 
     def test_clear_history(self):
         history = AgentHistory()
@@ -129,6 +129,106 @@ class TestAgentHistory:
         for i, msg in enumerate(history):
             assert msg["content"] == f"Message {i}"
 
+    def test_bounded_window_drops_oldest(self):
+        history = AgentHistory(maxlen=3)
+
+        for i in range(5):
+            history.add_message({"role": "user", "content": f"Message {i}"})
+
+        assert len(history) == 3
+        assert [msg["content"] for msg in history] == [
+            "Message 2",
+            "Message 3",
+            "Message 4",
+        ]
+
+    def test_promote_to_prefix_pins_messages(self):
+        history = AgentHistory(maxlen=2)
+
+        history.add_message({"role": "system", "content": "You are helpful."})
+        history.promote_to_prefix(1)
+
+        for i in range(4):
+            history.add_message({"role": "user", "content": f"Message {i}"})
+
+        assert len(history) == 3
+        messages = list(history)
+        assert messages[0]["role"] == "system"
+        assert [msg["content"] for msg in messages[1:]] == ["Message 2", "Message 3"]
+
+    def test_clear_resets_prefix_and_tail(self):
+        history = AgentHistory()
+
+        history.add_message({"role": "system", "content": "You are helpful."})
+        history.promote_to_prefix(1)
+        history.add_message({"role": "user", "content": "Hello"})
+
+        history.clear()
+        assert len(history) == 0
+        assert history.messages == []
+
+    def test_build_for_llm_without_budget_returns_all(self):
+        history = AgentHistory()
+
+        for i in range(5):
+            history.add_message({"role": "user", "content": f"Message {i}"})
+
+        assert history.build_for_llm() == history.messages
+
+    def test_build_for_llm_truncates_middle_not_prefix(self):
+        history = AgentHistory()
+
+        history.add_message({"role": "system", "content": "You are helpful."})
+        history.promote_to_prefix(1)
+        for i in range(10):
+            history.add_message({"role": "user", "content": f"Message {i}"})
+
+        built = history.build_for_llm(max_messages=5)
+
+        assert len(built) == 5
+        assert built[0]["role"] == "system"
+        assert built[0]["content"] == "You are helpful."
+        assert "truncated" in built[1]["content"]
+        assert [msg["content"] for msg in built[2:]] == [
+            "Message 7",
+            "Message 8",
+            "Message 9",
+        ]
+        # Source history is untouched
+        assert len(history) == 11
+
+    def test_build_for_llm_cache_buffer_promotes_prefix(self):
+        history = AgentHistory()
+
+        history.add_message({"role": "system", "content": "You are helpful."})
+        history.promote_to_prefix(1)
+        for i in range(10):
+            history.add_message({"role": "user", "content": f"Message {i}"})
+
+        history.build_for_llm(max_messages=5, cache_buffer=2)
+
+        built = history.build_for_llm(max_messages=5, cache_buffer=0)
+        assert built[0]["content"] == "You are helpful."
+        assert [msg["content"] for msg in built[1:3]] == ["Message 0", "Message 1"]
+
+    def test_build_for_llm_stays_bounded_over_many_turns(self):
+        history = AgentHistory()
+
+        history.add_message({"role": "system", "content": "You are helpful."})
+        history.promote_to_prefix(1)
+
+        for i in range(30):
+            history.add_message({"role": "user", "content": f"Message {i}"})
+            built = history.build_for_llm(max_messages=8, cache_buffer=2)
+            assert len(built) <= 8
+
+        built = history.build_for_llm(max_messages=8, cache_buffer=2)
+        assert len(built) == 8
+        assert built[0]["content"] == "You are helpful."
+        # The prefix stops growing once it would no longer fit the budget,
+        # so the most recent messages always survive truncation.
+        assert built[-1]["content"] == "Message 29"
+
     def test_history_with_complex_messages(self):
         history = AgentHistory()
 
@@ -42,7 +42,7 @@ class TestAgentIntegration:
             responses = agent.run("Hi", stream=False)
 
             assert len(responses) >= 1
-            assert responses[0] == mock_llm_response
+            assert responses[0] == ("assistant", mock_llm_response)
 
             messages = list(agent.history)
             roles = [msg["role"] for msg in messages]
@@ -60,7 +60,7 @@ class TestAgentIntegration:
 
             assert len(responses) >= 1
 
-            assert responses[0] == mock_llm_response
+            assert responses[0] == ("assistant", mock_llm_response)
 
     def test_custom_tool_integration(self, mock_llm_response):
         class WeatherTool(Tool):
@@ -113,7 +113,7 @@ class TestAgentIntegration:
                     break
 
             assert len(responses) >= 1
-            assert responses[0] == response
+            assert responses[0] == ("assistant", response)
 
     def test_multiple_tool_calls(self):
         response = Mock()
@@ -159,9 +159,11 @@ class TestAgentIntegration:
             responses = list(agent.run("Hi", stream=True))
 
             assert len(responses) == 2
-            assert responses[0] == response
-            assert isinstance(responses[1], list)
-            assert len(responses[1]) == 2
+            assert responses[0] == ("assistant", response)
+            kind, tool_messages = responses[1]
+            assert kind == "tool_result"
+            assert isinstance(tool_messages, list)
+            assert len(tool_messages) == 2
 
     def test_agent_history_persistence(self, mock_llm_response):
         with patch("stanley.agent.litellm.completion") as mock_completion:
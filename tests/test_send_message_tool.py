@@ -1,40 +1,43 @@
 """Tests for SendMessageToUser tool."""
 
+import pytest
+
 from stanley.tools.send_message import SendMessageToUser
 
+_UNICODE_MSG = "Hello 🌍! 你好 世界"
+
+
+@pytest.fixture(scope="module")
+def tool():
+    # None of the tests mutate the tool, so one instance serves the module.
+    return SendMessageToUser()
+
 
 class TestSendMessageToUser:
-    def test_initialization(self):
-        tool = SendMessageToUser()
+    def test_initialization(self, tool):
         assert tool.name == "send_message_to_user"
         assert tool.description == "Send a message to user and wait for response"
         assert "message" in tool.input_schema["properties"]
         assert tool.input_schema["properties"]["message"]["type"] == "string"
 
-    def test_execute_basic(self):
-        tool = SendMessageToUser()
+    def test_execute_basic(self, tool):
         result = tool.execute("Hello, user!")
         assert result == "Hello, user!"
 
-    def test_execute_empty_message(self):
-        tool = SendMessageToUser()
+    def test_execute_empty_message(self, tool):
         result = tool.execute("")
         assert result == ""
 
-    def test_execute_multiline_message(self):
-        tool = SendMessageToUser()
+    def test_execute_multiline_message(self, tool):
         message = "Line 1\nLine 2\nLine 3"
         result = tool.execute(message)
         assert result == message
 
-    def test_execute_unicode_message(self):
-        tool = SendMessageToUser()
-        message = "Hello 🌍! 你好 世界"
-        result = tool.execute(message)
-        assert result == message
+    def test_execute_unicode_message(self, tool):
+        result = tool.execute(_UNICODE_MSG)
+        assert result == _UNICODE_MSG
 
-    def test_input_schema_structure(self):
-        tool = SendMessageToUser()
+    def test_input_schema_structure(self, tool):
         schema = tool.input_schema
 
         assert schema["type"] == "object"
@@ -43,9 +46,7 @@ class TestSendMessageToUser:
         assert schema["properties"]["message"]["type"] == "string"
         assert schema["required"] == ["message"]
 
-    def test_schema_completeness(self):
-        tool = SendMessageToUser()
-
+    def test_schema_completeness(self, tool):
         assert hasattr(tool, "input_schema")
         assert hasattr(tool, "name")
         assert hasattr(tool, "description")
@@ -1,6 +1,9 @@
 """Unit tests for base_tool.py."""
 
+import operator
+import re
 from enum import Enum
+from functools import reduce
 from typing import Annotated
 
 import pytest
@@ -18,39 +21,123 @@ class Priority(Enum):
     LOW = "low"
 
 
-class TestGetOpenAISchemaFromFn:
-    def test_basic_types(self):
-        def func(name: str, age: int, score: float, active: bool):
-            pass
+# Subject functions live at module scope so their code objects and annotation
+# expressions (GenericAlias/UnionType allocations) are evaluated once at
+# import rather than on every test invocation.
+def _basic_types_func(name: str, age: int, score: float, active: bool):
+    pass
 
-        schema = get_openai_schema_from_fn(func)
 
-        assert schema["type"] == "object"
-        assert schema["properties"]["name"]["type"] == "string"
-        assert schema["properties"]["age"]["type"] == "integer"
-        assert schema["properties"]["score"]["type"] == "number"
-        assert schema["properties"]["active"]["type"] == "boolean"
-        assert schema["required"] == ["name", "age", "score", "active"]
+def _annotated_func(
+    name: Annotated[str, "User's full name"],
+    age: Annotated[int, "Age in years"],
+):
+    pass
+
+
+def _optional_params_func(
+    required: str, optional: str = "default", optional_none: str | None = None
+):
+    pass
+
+
+def _enum_func(priority: Priority):
+    pass
+
+
+def _list_types_func(tags: list[str], numbers: list[int], priorities: list[Priority]):
+    pass
+
+
+def _dict_types_func(
+    metadata: dict[str, str], scores: dict[str, int], config: dict[str, bool]
+):
+    pass
 
-    def test_annotated_with_descriptions(self):
-        def func(
-            name: Annotated[str, "User's full name"],
-            age: Annotated[int, "Age in years"],
-        ):
-            pass
 
-        schema = get_openai_schema_from_fn(func)
+def _method_with_self(self, name: str):
+    pass
+
+
+def _nested_func(
+    nested_list: list[list[str]],
+    nested_dict: dict[str, list[int]],
+    optional_complex: dict[str, list[Priority]] | None,
+):
+    pass
+
+
+EXPECTED_LIST_TYPES_PROPS = {
+    "tags": {"type": "array", "items": {"type": "string"}},
+    "numbers": {"type": "array", "items": {"type": "integer"}},
+    "priorities": {
+        "type": "array",
+        "items": {"type": "string", "enum": ["high", "medium", "low"]},
+    },
+}
+
+EXPECTED_COMPLEX_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "tags": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of tags",
+        },
+        "metadata": {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+            "description": "Key-value pairs",
+        },
+        "priority": {
+            "type": "string",
+            "enum": ["high", "medium", "low"],
+            "description": "Task priority",
+        },
+    },
+    "required": ["tags", "metadata", "priority"],
+}
+
+EXPECTED_DICT_TYPES_PROPS = {
+    "metadata": {"type": "object", "additionalProperties": {"type": "string"}},
+    "scores": {"type": "object", "additionalProperties": {"type": "integer"}},
+    "config": {"type": "object", "additionalProperties": {"type": "boolean"}},
+}
+
+
+@pytest.fixture(scope="module")
+def basic_schema():
+    return get_openai_schema_from_fn(_basic_types_func)
+
+
+@pytest.fixture(scope="module")
+def nested_schema():
+    return get_openai_schema_from_fn(_nested_func)
+
+
+class TestGetOpenAISchemaFromFn:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (("type",), "object"),
+            (("properties", "name", "type"), "string"),
+            (("properties", "age", "type"), "integer"),
+            (("properties", "score", "type"), "number"),
+            (("properties", "active", "type"), "boolean"),
+            (("required",), ["name", "age", "score", "active"]),
+        ],
+    )
+    def test_basic_types(self, basic_schema, path, expected):
+        assert reduce(operator.getitem, path, basic_schema) == expected
+
+    def test_annotated_with_descriptions(self):
+        schema = get_openai_schema_from_fn(_annotated_func)
 
         assert schema["properties"]["name"]["description"] == "User's full name"
         assert schema["properties"]["age"]["description"] == "Age in years"
 
     def test_optional_parameters(self):
-        def func(
-            required: str, optional: str = "default", optional_none: str | None = None
-        ):
-            pass
-
-        schema = get_openai_schema_from_fn(func)
+        schema = get_openai_schema_from_fn(_optional_params_func)
 
         assert schema["required"] == ["required"]
         assert "optional" not in schema["required"]
@@ -58,97 +145,58 @@ class TestGetOpenAISchemaFromFn:
         assert schema["properties"]["optional_none"]["nullable"] is True
 
     def test_enum_types(self):
-        def func(priority: Priority):
-            pass
-
-        schema = get_openai_schema_from_fn(func)
+        schema = get_openai_schema_from_fn(_enum_func)
 
         assert schema["properties"]["priority"]["type"] == "string"
         assert schema["properties"]["priority"]["enum"] == ["high", "medium", "low"]
 
     def test_list_types(self):
-        def func(tags: list[str], numbers: list[int], priorities: list[Priority]):
-            pass
-
-        schema = get_openai_schema_from_fn(func)
+        schema = get_openai_schema_from_fn(_list_types_func)
 
-        assert schema["properties"]["tags"]["type"] == "array"
-        assert schema["properties"]["tags"]["items"]["type"] == "string"
-
-        assert schema["properties"]["numbers"]["type"] == "array"
-        assert schema["properties"]["numbers"]["items"]["type"] == "integer"
-
-        assert schema["properties"]["priorities"]["type"] == "array"
-        assert schema["properties"]["priorities"]["items"]["type"] == "string"
-        assert schema["properties"]["priorities"]["items"]["enum"] == [
-            "high",
-            "medium",
-            "low",
-        ]
+        assert schema["properties"] == EXPECTED_LIST_TYPES_PROPS
+        assert schema["required"] == ["tags", "numbers", "priorities"]
 
     def test_dict_types(self):
-        def func(
-            metadata: dict[str, str], scores: dict[str, int], config: dict[str, bool]
-        ):
-            pass
-
-        schema = get_openai_schema_from_fn(func)
-
-        assert schema["properties"]["metadata"]["type"] == "object"
-        assert (
-            schema["properties"]["metadata"]["additionalProperties"]["type"] == "string"
-        )
-
-        assert schema["properties"]["scores"]["type"] == "object"
-        assert (
-            schema["properties"]["scores"]["additionalProperties"]["type"] == "integer"
-        )
-
-        assert schema["properties"]["config"]["type"] == "object"
-        assert (
-            schema["properties"]["config"]["additionalProperties"]["type"] == "boolean"
-        )
-
-    def test_nested_complex_types(self):
-        def func(
-            nested_list: list[list[str]],
-            nested_dict: dict[str, list[int]],
-            optional_complex: dict[str, list[Priority]] | None,
-        ):
-            pass
-
-        schema = get_openai_schema_from_fn(func)
-
-        assert schema["properties"]["nested_list"]["type"] == "array"
-        assert schema["properties"]["nested_list"]["items"]["type"] == "array"
-        assert schema["properties"]["nested_list"]["items"]["items"]["type"] == "string"
-
-        assert schema["properties"]["nested_dict"]["type"] == "object"
-        assert (
-            schema["properties"]["nested_dict"]["additionalProperties"]["type"]
-            == "array"
-        )
-        assert (
-            schema["properties"]["nested_dict"]["additionalProperties"]["items"]["type"]
-            == "integer"
-        )
-
-        assert schema["properties"]["optional_complex"]["type"] == "object"
-        assert schema["properties"]["optional_complex"]["nullable"] is True
-        assert (
-            schema["properties"]["optional_complex"]["additionalProperties"]["type"]
-            == "array"
-        )
-        assert schema["properties"]["optional_complex"]["additionalProperties"][
-            "items"
-        ]["enum"] == ["high", "medium", "low"]
+        schema = get_openai_schema_from_fn(_dict_types_func)
+
+        assert schema["properties"] == EXPECTED_DICT_TYPES_PROPS
+        assert schema["required"] == ["metadata", "scores", "config"]
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (("properties", "nested_list", "type"), "array"),
+            (("properties", "nested_list", "items", "type"), "array"),
+            (("properties", "nested_list", "items", "items", "type"), "string"),
+            (("properties", "nested_dict", "type"), "object"),
+            (("properties", "nested_dict", "additionalProperties", "type"), "array"),
+            (
+                ("properties", "nested_dict", "additionalProperties", "items", "type"),
+                "integer",
+            ),
+            (("properties", "optional_complex", "type"), "object"),
+            (("properties", "optional_complex", "nullable"), True),
+            (
+                ("properties", "optional_complex", "additionalProperties", "type"),
+                "array",
+            ),
+            (
+                (
+                    "properties",
+                    "optional_complex",
+                    "additionalProperties",
+                    "items",
+                    "enum",
+                ),
+                ["high", "medium", "low"],
+            ),
+        ],
+    )
+    def test_nested_complex_types(self, nested_schema, path, expected):
+        assert reduce(operator.getitem, path, nested_schema) == expected
 
     def test_self_parameter_ignored(self):
-        class TestClass:
-            def method(self, name: str):
-                pass
-
-        schema = get_openai_schema_from_fn(TestClass.method)
+        schema = get_openai_schema_from_fn(_method_with_self)
 
         assert "self" not in schema["properties"]
         assert "name" in schema["properties"]
@@ -159,29 +207,23 @@ class TestEnforceExecuteTypeAnnotations:
         def execute(self, name, age: int):
             pass
 
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match=re.escape("Missing: ['name']")):
             enforce_execute_type_annotations(execute)
 
-        assert "Missing: ['name']" in str(exc_info.value)
-
     def test_multiple_missing_annotations(self):
         def execute(self, name: str, age, location) -> str:
             pass
 
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match=re.escape("Missing: ['age', 'location']")):
             enforce_execute_type_annotations(execute)
 
-        assert "Missing: ['age', 'location']" in str(exc_info.value)
-
     def test_missing_return_annotation(self):
         def execute(self, name: str):
             pass
 
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match="must have a return type annotation"):
             enforce_execute_type_annotations(execute)
 
-        assert "must have a return type annotation" in str(exc_info.value)
-
     def test_valid_annotations(self):
         def execute(self, name: str, age: int) -> str:
             return f"{name} is {age}"
@@ -220,21 +262,10 @@ class TestToolClass:
 
         tool = ComplexTool(name="complex", description="Complex tool")
 
-        props = tool.input_schema["properties"]
-
-        assert props["tags"]["type"] == "array"
-        assert props["tags"]["description"] == "List of tags"
-        assert props["tags"]["items"]["type"] == "string"
-
-        assert props["metadata"]["type"] == "object"
-        assert props["metadata"]["description"] == "Key-value pairs"
-
-        assert props["priority"]["type"] == "string"
-        assert props["priority"]["description"] == "Task priority"
-        assert props["priority"]["enum"] == ["high", "medium", "low"]
+        assert tool.input_schema == EXPECTED_COMPLEX_SCHEMA
 
     def test_tool_missing_annotations_raises(self):
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match="must have type annotations"):
 
             class BadTool(Tool):
                 def execute(self, message):
@@ -242,8 +273,6 @@ class TestToolClass:
 
             BadTool(name="bad", description="Bad tool")
 
-        assert "must have type annotations" in str(exc_info.value)
-
     def test_abstract_execute_not_implemented(self):
         class MinimalTool(Tool):
             def execute(self) -> None: